@@ -2,6 +2,13 @@
 CAMERA_INDEX: int = 0
 FRAME_WIDTH: int | None = None
 FRAME_HEIGHT: int | None = None
+CAMERA_FPS: int | None = 30
+
+# Mirror the preview window (the cursor is always mirrored in CursorMapper).
+# Mirroring costs one full-frame cv2.flip per displayed frame; only turning
+# this off saves it. On by default because an unmirrored preview moves
+# opposite to the hand and cursor.
+MIRROR_DISPLAY: bool = True
 
 
 # MediaPipe Hand Tracking
@@ -9,6 +16,16 @@ DETECTION_CONFIDENCE: float = 0.7
 TRACKING_CONFIDENCE: float = 0.7
 MAX_NUM_HANDS: int = 1
 
+# Landmark model: 0 = lite (fastest on CPU), 1 = full
+MODEL_COMPLEXITY: int = 0
+
+# Frames are downscaled to this width before inference only; the height
+# keeps the camera's aspect ratio (640x480 -> 320x240, 1280x720 -> 320x180)
+INFERENCE_FRAME_WIDTH: int | None = 320
+
+# Run inference on every Nth frame while a hand is tracked (1 = every frame)
+DETECT_EVERY_N_FRAMES: int = 2
+
 
 # Landmark index
 INDEX_FINGER_TIP: int = 8
@@ -20,11 +37,20 @@ REACQUIRE_DELAY = 6
 
 # Pinch click settings
 PINCH_THRESHOLD: int = 40
+# Non-pinch frames needed before a pinch counts as released; rides out
+# single-frame tracking dropouts without delaying the click itself
+PINCH_RELEASE_FRAMES: int = 3
 CLICK_COOLDOWN_FRAMES: int = 15
 
 # Safety toggle
 ENABLE_CLICKS: bool = True
 
+# Debug view: draw the full landmark skeleton (toggle with 'd' at runtime)
+DRAW_LANDMARKS: bool = False
+
+# Debug text overlay (reacquire counter)
+DEBUG_OVERLAY: bool = False
+
 
 def get_smoothing_alpha() -> float:
     return 1.0 / SMOOTHING_FACTOR
@@ -1,42 +1,146 @@
 # src/app/main.py
 
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
 import cv2
+import numpy as np
 
-from core.camera import Camera
+from core.camera import Camera, LatestFrameGrabber
 from core.hand_tracker import HandTracker
 from core.smoothing import Smoother
 from core.cursor_mapper import CursorMapper
 from core.gesture_recognizer import GestureRecognizer
 from core.actions import ActionController
+from core import mouse_backend
+from utils.highgui import poll_key
+from utils.logging_utils import setup_logging
 
 from app import config
 
+_log = logging.getLogger(__name__)
 
-def main() -> None:
-
-    # -------------------------------
-    # Initialize Core Components
-    # -------------------------------
-    camera = Camera(
-        device_index=config.CAMERA_INDEX,
-        frame_width=config.FRAME_WIDTH,
-        frame_height=config.FRAME_HEIGHT,
-    )
-
-    hand_tracker = HandTracker(
-        max_num_hands=config.MAX_NUM_HANDS,
-        detection_confidence=config.DETECTION_CONFIDENCE,
-        tracking_confidence=config.TRACKING_CONFIDENCE,
-    )
-
-    smoother = Smoother(alpha=config.get_smoothing_alpha())
-    cursor_mapper = CursorMapper(smoother=smoother)
-
-    gesture_recognizer = GestureRecognizer(
-        pinch_threshold=config.PINCH_THRESHOLD
-    )
 
-    action_controller = ActionController()
+def _put_latest(q: queue.Queue, item) -> None:
+    """Put item into a single-slot queue, dropping the stale item if full."""
+    try:
+        q.get_nowait()
+    except queue.Empty:
+        pass
+    q.put_nowait(item)
+
+
+def _infer_worker(
+    hand_tracker: HandTracker,
+    grabber: LatestFrameGrabber,
+    q_render: queue.Queue,
+    stop_event: threading.Event,
+    draw_debug: threading.Event,
+    detect_every_n: int = 1,
+) -> None:
+    """
+    Stage 2: run MediaPipe on the newest frame, hand results to render.
+
+    While a hand is tracked, inference only runs on every
+    `detect_every_n`-th frame; frames in between reuse the last landmarks
+    and the cursor smoother interpolates towards them. With the landmark
+    debug view on, every frame is detected.
+    """
+    frame_idx = 0
+    last_landmarks: Optional[np.ndarray] = None
+    detect_failing = False
+
+    # Hot methods bound once, outside the frame loop
+    latest = grabber.latest
+    detect = hand_tracker.detect
+    is_drawing = draw_debug.is_set
+    is_stopped = stop_event.is_set
+
+    while not is_stopped():
+        frame = latest(timeout=0.1)
+        if frame is None:
+            continue
+
+        # Skipped frames carry no skeleton, so the debug view detects on
+        # every frame to avoid flicker
+        frame_idx += 1
+        if (
+            last_landmarks is not None
+            and frame_idx % detect_every_n != 0
+            and not is_drawing()
+        ):
+            _put_latest(q_render, (frame, last_landmarks))
+            continue
+
+        # Full landmark skeleton is only drawn when debug view is on.
+        # A failing frame must not kill the worker, and the raw frame is
+        # still forwarded as "no hand" so display and key handling go on.
+        try:
+            annotated_frame, landmarks = detect(frame, draw=is_drawing())
+        except Exception:
+            # Log once per run of failures, not at frame rate
+            if not detect_failing:
+                _log.exception("Hand detection failed")
+                detect_failing = True
+            annotated_frame, landmarks = frame, None
+        else:
+            if detect_failing:
+                _log.info("Hand detection recovered")
+                detect_failing = False
+
+        last_landmarks = landmarks
+        _put_latest(q_render, (annotated_frame, landmarks))
+
+
+def _handle_key(draw_debug: threading.Event) -> bool:
+    """
+    Poll the HighGUI keyboard.
+
+    'd' toggles the landmark debug view, 'q' quits.
+
+    Returns:
+        True if the user asked to quit.
+    """
+    key = poll_key()
+    if key == -1:
+        return False
+
+    key &= 0xFF
+
+    if key == ord("d"):
+        if draw_debug.is_set():
+            draw_debug.clear()
+        else:
+            draw_debug.set()
+
+    return key == ord("q")
+
+
+def _render_worker(
+    q_render: queue.Queue,
+    stop_event: threading.Event,
+    draw_debug: threading.Event,
+    cursor_mapper: CursorMapper,
+    gesture_recognizer: GestureRecognizer,
+    action_controller: ActionController,
+    click_executor: ThreadPoolExecutor,
+    mirror_display: bool = True,
+    display: Optional[Callable[[np.ndarray], None]] = None,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> None:
+    """
+    Stage 3: cursor movement, click detection and display.
+
+    Runs on the calling (main) thread because OpenCV HighGUI must own
+    the window there. It is the only stage touching the cursor mapper,
+    gesture recognizer and action controller, so they need no lock.
+
+    If `display` is given, finished frames are handed to it instead of an
+    OpenCV window and `should_stop` is polled to end the loop.
+    """
 
     # -------------------------------
     # Click Feedback + Cooldown
@@ -50,31 +154,58 @@ def main() -> None:
     hand_visible = False
     reacquire_frames = 0
 
-    REACQUIRE_DELAY = 6  # wait 6 frames after hand returns
-
-    try:
-        while True:
-
-            frame = camera.get_frame()
-            if frame is None:
-                continue
-
-            annotated_frame, landmarks = hand_tracker.detect(frame, draw=True)
-
-            # -------------------------------
-            # HAND LOST → Freeze Cursor
-            # -------------------------------
-            if not landmarks:
-                hand_visible = False
-                reacquire_frames = 0
-                gesture_recognizer.reset_state()
-
-                cv2.imshow("Hand Gesture HCI - Phase 2", annotated_frame)
-
-                if cv2.waitKey(1) & 0xFF == ord("q"):
-                    break
+    REACQUIRE_DELAY = config.REACQUIRE_DELAY  # wait N frames after hand returns
+
+    # Settings are read once; bind them to locals for the frame loop
+    INDEX_FINGER_TIP = config.INDEX_FINGER_TIP
+    ENABLE_CLICKS = config.ENABLE_CLICKS
+    CLICK_COOLDOWN_FRAMES = config.CLICK_COOLDOWN_FRAMES
+    DEBUG_OVERLAY = config.DEBUG_OVERLAY
+
+    # Hot methods bound once, outside the frame loop
+    get_result = q_render.get
+    is_stopped = stop_event.is_set
+    move_cursor = cursor_mapper.move_cursor
+    detect_click_event = gesture_recognizer.detect_click_event
+    reset_gesture_state = gesture_recognizer.reset_state
+    submit_click = click_executor.submit
+    left_click = action_controller.left_click
+    put_text = cv2.putText
+    circle = cv2.circle
+    flip = cv2.flip
+    imshow = cv2.imshow
+
+    # Clicks run on the executor; their exceptions (e.g. PyAutoGUI's
+    # FailSafeException) are handed back and re-raised on this thread
+    click_errors: "queue.SimpleQueue[BaseException]" = queue.SimpleQueue()
+
+    def on_click_done(future: Future) -> None:
+        exc = future.exception()
+        if exc is not None:
+            click_errors.put(exc)
+
+    def stop_requested() -> bool:
+        # Embedding UI decides via should_stop; our own window via the keyboard
+        if display is not None:
+            return should_stop()
+        return _handle_key(draw_debug)
+
+    while not is_stopped():
+
+        if not click_errors.empty():
+            raise click_errors.get()
+
+        try:
+            annotated_frame, landmarks = get_result(timeout=0.1)
+        except queue.Empty:
+            # No frame yet (or the camera is gone): still honour a stop
+            # request and keep the HighGUI window responsive
+            if stop_requested():
+                stop_event.set()
+                break
+            continue
 
-                continue
+        if landmarks is not None:
 
             # -------------------------------
             # HAND RE-ENTERED → Start Delay
@@ -93,30 +224,25 @@ def main() -> None:
             # -------------------------------
             if reacquire_frames == 0:
 
-                index_points = [
-                    lm for lm in landmarks
-                    if lm[0] == config.INDEX_FINGER_TIP
-                ]
-
-                if index_points:
-                    _, x, y = index_points[0]
+                # Row i holds landmark id i; cv2 wants plain ints
+                x, y = landmarks[INDEX_FINGER_TIP].tolist()
 
-                    h, w, _ = annotated_frame.shape
+                h, w, _ = annotated_frame.shape
 
-                    cursor_mapper.move_cursor(
-                        x_frame=x,
-                        y_frame=y,
-                        frame_width=w,
-                        frame_height=h,
-                    )
+                move_cursor(
+                    x_frame=x,
+                    y_frame=y,
+                    frame_width=w,
+                    frame_height=h,
+                )
 
-                    cv2.circle(
-                        annotated_frame,
-                        (x, y),
-                        8,
-                        (0, 255, 255),
-                        -1,
-                    )
+                circle(
+                    annotated_frame,
+                    (x, y),
+                    8,
+                    (0, 255, 255),
+                    -1,
+                )
 
             # -------------------------------
             # Phase 2: Pinch Click Detection
@@ -124,19 +250,36 @@ def main() -> None:
             if click_cooldown > 0:
                 click_cooldown -= 1
 
-            if gesture_recognizer.detect_click_event(landmarks):
+            if detect_click_event(landmarks):
                 if click_cooldown == 0:
-                    if config.ENABLE_CLICKS:
-                        action_controller.left_click()
+                    if ENABLE_CLICKS:
+                        # OS input calls can block; keep them off this loop
+                        submit_click(left_click).add_done_callback(on_click_done)
 
                     click_feedback_frames = 10
-                    click_cooldown = config.CLICK_COOLDOWN_FRAMES
+                    click_cooldown = CLICK_COOLDOWN_FRAMES
+
+        else:
 
             # -------------------------------
-            # Visual Feedback Overlay
+            # HAND LOST → Freeze Cursor
             # -------------------------------
+            hand_visible = False
+            reacquire_frames = 0
+            reset_gesture_state()
+
+        # Camera frames are not mirrored; flip only the displayed image
+        # (a full-frame copy, skipped when MIRROR_DISPLAY is off).
+        # Text is drawn afterwards so it stays readable.
+        if mirror_display:
+            annotated_frame = flip(annotated_frame, 1)
+
+        # -------------------------------
+        # Visual Feedback Overlay
+        # -------------------------------
+        if hand_visible:
             if click_feedback_frames > 0:
-                cv2.putText(
+                put_text(
                     annotated_frame,
                     "CLICK",
                     (30, 80),
@@ -148,27 +291,141 @@ def main() -> None:
                 click_feedback_frames -= 1
 
             # Debug: Reacquire counter
-            cv2.putText(
-                annotated_frame,
-                f"Reacquire: {reacquire_frames}",
-                (30, 140),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                1,
-                (255, 255, 255),
-                2,
-            )
-
-            # Show window
-            cv2.imshow("Hand Gesture HCI - Phase 2", annotated_frame)
-
-            if cv2.waitKey(1) & 0xFF == ord("q"):
-                break
+            if DEBUG_OVERLAY:
+                put_text(
+                    annotated_frame,
+                    f"Reacquire: {reacquire_frames}",
+                    (30, 140),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    1,
+                    (255, 255, 255),
+                    2,
+                )
+
+        # Hand the frame to the embedding UI, or show our own window
+        if display is not None:
+            display(annotated_frame)
+        else:
+            imshow("Hand Gesture HCI - Phase 2", annotated_frame)
+
+        if stop_requested():
+            stop_event.set()
+            break
+
+
+def main(
+    display: Optional[Callable[[np.ndarray], None]] = None,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> None:
+    """
+    Run the gesture control loop.
+
+    Args:
+        display: Optional callback receiving each finished BGR frame. When
+                 given, no OpenCV window is opened, so an embedding UI owns
+                 the only render path.
+        should_stop: Polled when `display` is given, once per frame and
+                     every 0.1 s while no frame arrives; return True to
+                     end the loop.
+    """
+
+    # -------------------------------
+    # Initialize Core Components
+    # -------------------------------
+    camera = Camera(
+        device_index=config.CAMERA_INDEX,
+        frame_width=config.FRAME_WIDTH,
+        frame_height=config.FRAME_HEIGHT,
+        fps=config.CAMERA_FPS,
+        mirror=False,
+    )
+
+    hand_tracker = HandTracker(
+        max_num_hands=config.MAX_NUM_HANDS,
+        detection_confidence=config.DETECTION_CONFIDENCE,
+        tracking_confidence=config.TRACKING_CONFIDENCE,
+        inference_width=config.INFERENCE_FRAME_WIDTH,
+        model_complexity=config.MODEL_COMPLEXITY,
+    )
+
+    smoother = Smoother(alpha=config.get_smoothing_alpha())
+    cursor_mapper = CursorMapper(
+        smoother=smoother,
+        mirror=True,
+        backend=mouse_backend,
+    )
+
+    gesture_recognizer = GestureRecognizer(
+        pinch_threshold=config.PINCH_THRESHOLD,
+        release_frames=config.PINCH_RELEASE_FRAMES,
+    )
+
+    action_controller = ActionController(backend=mouse_backend)
+
+    # Single worker keeps mouse actions in submission order
+    click_executor = ThreadPoolExecutor(max_workers=1)
+
+    # -------------------------------
+    # Pipeline: capture → infer → render
+    # Each stage only ever hands on the newest item
+    # -------------------------------
+    grabber = LatestFrameGrabber(camera)
+    q_render: queue.Queue = queue.Queue(maxsize=1)
+    stop_event = threading.Event()
+
+    draw_debug = threading.Event()
+    if config.DRAW_LANDMARKS:
+        draw_debug.set()
+
+    workers = [
+        threading.Thread(
+            target=_infer_worker,
+            args=(
+                hand_tracker,
+                grabber,
+                q_render,
+                stop_event,
+                draw_debug,
+                config.DETECT_EVERY_N_FRAMES,
+            ),
+            daemon=True,
+        ),
+    ]
+
+    try:
+        grabber.start()
+        for worker in workers:
+            worker.start()
+
+        _render_worker(
+            q_render,
+            stop_event,
+            draw_debug,
+            cursor_mapper,
+            gesture_recognizer,
+            action_controller,
+            click_executor,
+            mirror_display=config.MIRROR_DISPLAY,
+            display=display,
+            should_stop=should_stop,
+        )
 
     finally:
+        stop_event.set()
+        for worker in workers:
+            worker.join(timeout=1.0)
+        grabber.stop()
+        click_executor.shutdown(wait=True)
+
         hand_tracker.close()
         camera.release()
-        cv2.destroyAllWindows()
+
+        # Only our own window exists; HighGUI may be absent or off-thread
+        # when an embedding UI renders
+        if display is None:
+            cv2.destroyAllWindows()
 
 
 if __name__ == "__main__":
+    setup_logging()
     main()
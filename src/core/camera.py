@@ -1,7 +1,26 @@
+import logging
+import threading
+import time
 from typing import Optional, Tuple
 
 import cv2
 
+from utils.highgui import poll_key
+
+
+_log = logging.getLogger(__name__)
+
+# get_frame() drains frames the driver buffered while nobody was reading:
+# a buffered grab() returns almost instantly, a fresh one waits for the
+# sensor. A grab slower than this fraction of the frame interval is fresh.
+FRESH_GRAB_FRACTION = 0.5
+MAX_STALE_GRABS = 4
+DEFAULT_FPS = 30
+
+# LatestFrameGrabber waits this long after a failed grab (e.g. camera
+# unplugged) instead of spinning and starving the other threads
+GRAB_RETRY_SEC = 0.01
+
 
 class Camera:
     """
@@ -10,7 +29,7 @@ class Camera:
     Features:
     - Initialize webcam capture
     - Provide get_frame() for the latest frame
-    - Flip frames horizontally for natural interaction
+    - Optionally flip frames horizontally for natural interaction
     - Clean release() method for later phases
     """
 
@@ -19,6 +38,8 @@ class Camera:
         device_index: int = 0,
         frame_width: Optional[int] = None,
         frame_height: Optional[int] = None,
+        mirror: bool = True,
+        fps: Optional[int] = None,
     ) -> None:
         """
         Initialize the webcam.
@@ -27,36 +48,89 @@ class Camera:
             device_index: Index of the camera (0 is default webcam).
             frame_width: Optional desired frame width.
             frame_height: Optional desired frame height.
+            mirror: If True, flip frames horizontally. Callers that mirror
+                    in cursor mapping instead can skip this per-frame copy.
+            fps: Optional desired capture frame rate.
         """
+        self._mirror = mirror
+        self._fresh_grab_sec = FRESH_GRAB_FRACTION / (fps or DEFAULT_FPS)
+
         self._cap = cv2.VideoCapture(device_index)
         if not self._cap.isOpened():
             raise RuntimeError(f"Could not open camera with index {device_index}")
 
+        # Request MJPEG first: cheaper to decode and less USB bandwidth than
+        # raw YUYV, and it must be set before the resolution to take effect
+        self._set_property(
+            cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"), "FOURCC"
+        )
+
         # Optionally set desired resolution (if supported by the device)
         if frame_width is not None:
-            self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, frame_width)
+            self._set_property(cv2.CAP_PROP_FRAME_WIDTH, frame_width, "FRAME_WIDTH")
         if frame_height is not None:
-            self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, frame_height)
+            self._set_property(cv2.CAP_PROP_FRAME_HEIGHT, frame_height, "FRAME_HEIGHT")
+        if fps is not None:
+            self._set_property(cv2.CAP_PROP_FPS, fps, "FPS")
 
-    def get_frame(self) -> Optional["cv2.Mat"]:
+        # Keep the driver queue short so reads return a recent frame
+        self._set_property(cv2.CAP_PROP_BUFFERSIZE, 1, "BUFFERSIZE")
+
+    def _set_property(self, prop_id: int, value: float, name: str) -> None:
+        """Set a capture property, reporting when the driver refuses it."""
+        if not self._cap.set(prop_id, value):
+            _log.warning("Driver ignored %s=%s", name, value)
+
+    def grab(self) -> bool:
         """
-        Read a single frame from the webcam and flip it horizontally.
+        Advance to the next frame without decoding it.
 
         Returns:
-            frame: BGR image flipped horizontally, or None if capture failed.
+            True if a frame was grabbed.
         """
         if not self._cap.isOpened():
-            return None
+            return False
 
-        success, frame = self._cap.read()
+        return self._cap.grab()
+
+    def retrieve(self) -> Optional["cv2.Mat"]:
+        """
+        Decode the most recently grabbed frame, flipped if mirror=True.
+
+        Returns:
+            frame: BGR image, or None if decoding failed.
+        """
+        success, frame = self._cap.retrieve()
         if not success or frame is None:
             return None
 
+        if not self._mirror:
+            return frame
+
         # Flip horizontally for mirror-like, natural interaction
         frame_flipped = cv2.flip(frame, 1)  # flipCode=1: horizontal flip[web:36][web:33]
 
         return frame_flipped
 
+    def get_frame(self) -> Optional["cv2.Mat"]:
+        """
+        Read a single frame from the webcam, flipped horizontally if mirror=True.
+
+        Frames that were already buffered by the driver are skipped, even
+        on backends that ignore CAP_PROP_BUFFERSIZE.
+
+        Returns:
+            frame: BGR image, or None if capture failed.
+        """
+        for _ in range(MAX_STALE_GRABS + 1):
+            t0 = time.perf_counter()
+            if not self.grab():
+                return None
+            if time.perf_counter() - t0 >= self._fresh_grab_sec:
+                break
+
+        return self.retrieve()
+
     def release(self) -> None:
         """
         Release the camera resource.
@@ -65,6 +139,90 @@ class Camera:
             self._cap.release()  # Properly closes the capturing device[web:37][web:39]
 
 
+class LatestFrameGrabber:
+    """
+    Grabs frames from a Camera on a background daemon thread and keeps only
+    the newest one.
+
+    The thread keeps the driver drained with grab(), but only decodes a
+    frame with retrieve() while a consumer is waiting for one. Frames that
+    arrive while the consumer is busy are dropped without being decoded,
+    and the consumer always gets a frame captured after it asked.
+    """
+
+    def __init__(self, camera: "Camera") -> None:
+        """
+        Args:
+            camera: Camera to read from. Its grab()/retrieve() are only
+                    called from the grabber thread once started.
+        """
+        self._camera = camera
+        self._cond = threading.Condition()
+        self._latest: Optional["cv2.Mat"] = None
+        self._seq = 0
+        self._read_seq = 0
+        self._wanted = False
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "LatestFrameGrabber":
+        """Start the background reader thread."""
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            if not self._camera.grab():
+                self._stop_event.wait(GRAB_RETRY_SEC)
+                continue
+
+            # Nobody waiting: drop this frame without decoding it
+            with self._cond:
+                if not self._wanted:
+                    continue
+
+            frame = self._camera.retrieve()
+            if frame is None:
+                continue
+
+            with self._cond:
+                self._latest = frame
+                self._seq += 1
+                self._wanted = False
+                self._cond.notify_all()
+
+    def latest(self, timeout: Optional[float] = None) -> Optional["cv2.Mat"]:
+        """
+        Wait for a frame newer than the one previously returned.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever).
+
+        Returns:
+            frame: Newest frame, or None if no new frame arrived in time.
+        """
+        with self._cond:
+            if self._seq == self._read_seq:
+                self._wanted = True
+
+            has_new = self._cond.wait_for(
+                lambda: self._seq != self._read_seq,
+                timeout=timeout,
+            )
+            if not has_new:
+                return None
+
+            self._read_seq = self._seq
+            return self._latest
+
+    def stop(self) -> None:
+        """Stop the reader thread. The camera itself is not released."""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+
+
 def demo() -> None:
     """
     Simple manual test for the Camera class.
@@ -78,7 +236,8 @@ def demo() -> None:
             break
 
         cv2.imshow("Camera Demo (flipped)", frame)
-        if cv2.waitKey(1) & 0xFF == ord("q"):
+        key = poll_key()
+        if key != -1 and key & 0xFF == ord("q"):
             break
 
     cam.release()
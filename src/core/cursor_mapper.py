@@ -14,15 +14,31 @@ class CursorMapper:
     - Integrates a Smoother instance for stable motion
     """
 
-    def __init__(self, smoother: Optional[Smoother] = None) -> None:
+    def __init__(
+        self,
+        smoother: Optional[Smoother] = None,
+        mirror: bool = False,
+        backend: Optional[object] = None,
+    ) -> None:
         """
         Args:
             smoother: Optional Smoother instance for cursor stabilization.
                       If None, raw coordinates are used.
+            mirror: If True, flip the x-axis so an un-mirrored camera frame
+                    still moves the cursor like a mirror image.
+            backend: Object providing moveTo(x, y), e.g. core.mouse_backend.
+                     Defaults to pyautogui.
         """
+        self._mirror = mirror
+        self._backend = backend if backend is not None else pyautogui
         self._screen_width, self._screen_height = pyautogui.size()  # Get primary screen size[web:59][web:60][web:66]
         self._smoother = smoother
 
+        # Frame → screen scale factors, recomputed only when the frame size changes
+        self._frame_size: Optional[tuple[int, int]] = None
+        self._scale_x = 0.0
+        self._scale_y = 0.0
+
     def _map_to_screen(
         self,
         x_frame: int,
@@ -42,13 +58,14 @@ class CursorMapper:
         Returns:
             (screen_x, screen_y): Coordinates on the primary screen.
         """
-        # Normalize to [0, 1]
-        x_norm = x_frame / float(frame_width)
-        y_norm = y_frame / float(frame_height)
+        if self._frame_size != (frame_width, frame_height):
+            self._frame_size = (frame_width, frame_height)
+            self._scale_x = self._screen_width / frame_width
+            self._scale_y = self._screen_height / frame_height
 
         # Scale to screen size
-        screen_x = x_norm * self._screen_width
-        screen_y = y_norm * self._screen_height  # Direct mapping; adjust if you use ROI[web:64][web:67]
+        screen_x = x_frame * self._scale_x
+        screen_y = y_frame * self._scale_y  # Direct mapping; adjust if you use ROI[web:64][web:67]
 
         return screen_x, screen_y
 
@@ -68,6 +85,10 @@ class CursorMapper:
             frame_width: Width of the current frame.
             frame_height: Height of the current frame.
         """
+        # Mirror in coordinate space instead of flipping every frame
+        if self._mirror:
+            x_frame = frame_width - x_frame
+
         # Map camera coordinates → screen coordinates
         screen_x, screen_y = self._map_to_screen(
             x_frame=x_frame,
@@ -81,4 +102,4 @@ class CursorMapper:
             screen_x, screen_y = self._smoother.smooth(screen_x, screen_y)
 
         # Move the OS cursor (no clicking in Phase 1)
-        pyautogui.moveTo(screen_x, screen_y)  # Absolute movement[web:59][web:61][web:68]
+        self._backend.moveTo(screen_x, screen_y)  # Absolute movement[web:59][web:61][web:68]
@@ -7,62 +7,121 @@ Features:
 - Pinch detection (Thumb + Index)
 - Debounced click event (one click per pinch)
 - Reset when hand disappears
+
+Landmarks are the (21, 2) array of (x, y) returned by HandTracker.detect,
+or a list of (id, x, y) tuples.
 """
 
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
+
+import numpy as np
+
+Landmarks = Union[np.ndarray, List[Tuple[int, int, int]]]
 
 
 class GestureRecognizer:
-    def __init__(self, pinch_threshold: int = 40) -> None:
+    def __init__(self, pinch_threshold: int = 40, release_frames: int = 1) -> None:
+        """
+        Args:
+            pinch_threshold: Max thumb-index tip distance (pixels) for a pinch.
+            release_frames: Consecutive non-pinch frames before a pinch counts
+                            as released. The click still fires on the first
+                            pinch frame; only the release is deferred.
+        """
         self.THUMB_TIP = 4
         self.INDEX_TIP = 8
 
-        self._pinch_threshold = pinch_threshold
+        self.set_pinch_threshold(pinch_threshold)
+        self._release_frames = max(1, release_frames)
+        self._release_count = 0
         self._pinch_active = False
 
+    def set_pinch_threshold(self, pinch_threshold: int) -> None:
+        """Change the pinch distance (pixels) used by is_pinch."""
+        self._pinch_threshold = pinch_threshold
+        # Compare squared distances so the hot path needs no sqrt
+        self._pinch_threshold_sq = pinch_threshold * pinch_threshold
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        # One-slot cache of the last is_pinch result. The frame loop re-sends
+        # the same landmarks object on frames where detection was skipped.
+        # A reference is kept (not id()) so a recycled id can never match.
+        self._cached_landmarks: Optional[Landmarks] = None
+        self._cached_pinch = False
+
     def _get_point(
         self,
-        landmarks: List[Tuple[int, int, int]],
+        landmarks: Landmarks,
         landmark_id: int,
     ) -> Optional[Tuple[int, int]]:
+        if isinstance(landmarks, np.ndarray):
+            # Rows are indexed by landmark id
+            x, y = landmarks[landmark_id].tolist()
+            return (x, y)
+
+        # Full hands arrive ordered by id; sparse lists fall back to a scan
+        if landmark_id < len(landmarks):
+            lm_id, x, y = landmarks[landmark_id]
+            if lm_id == landmark_id:
+                return (x, y)
+
         for lm_id, x, y in landmarks:
             if lm_id == landmark_id:
                 return (x, y)
         return None
 
-    def _distance(self, p1: Tuple[int, int], p2: Tuple[int, int]) -> float:
-        return ((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2) ** 0.5
+    def _distance_sq(self, p1: Tuple[int, int], p2: Tuple[int, int]) -> int:
+        dx = p2[0] - p1[0]
+        dy = p2[1] - p1[1]
+        return dx * dx + dy * dy
 
-    def is_pinch(self, landmarks: List[Tuple[int, int, int]]) -> bool:
-        if not landmarks:
+    def is_pinch(self, landmarks: Optional[Landmarks]) -> bool:
+        if landmarks is None or len(landmarks) == 0:
             return False
 
+        if landmarks is self._cached_landmarks:
+            return self._cached_pinch
+
         thumb = self._get_point(landmarks, self.THUMB_TIP)
         index = self._get_point(landmarks, self.INDEX_TIP)
 
-        if thumb is None or index is None:
-            return False
+        pinch = (
+            thumb is not None
+            and index is not None
+            and self._distance_sq(thumb, index) <= self._pinch_threshold_sq
+        )
 
-        return self._distance(thumb, index) <= self._pinch_threshold
+        self._cached_landmarks = landmarks
+        self._cached_pinch = pinch
+        return pinch
 
-    def detect_click_event(self, landmarks: List[Tuple[int, int, int]]) -> bool:
+    def detect_click_event(self, landmarks: Optional[Landmarks]) -> bool:
         """
         Returns True only once when pinch starts (False → True transition).
         """
 
-        if not landmarks:
+        if landmarks is None or len(landmarks) == 0:
             self.reset_state()
             return False
 
-        current_pinch = self.is_pinch(landmarks)
+        if self.is_pinch(landmarks):
+            self._release_count = 0
+            click = not self._pinch_active
+            self._pinch_active = True
+            return click
 
-        click = False
-        if current_pinch and not self._pinch_active:
-            click = True
+        # Trailing-edge debounce: release only after enough open frames
+        if self._pinch_active:
+            self._release_count += 1
+            if self._release_count >= self._release_frames:
+                self._pinch_active = False
+                self._release_count = 0
 
-        self._pinch_active = current_pinch
-        return click
+        return False
 
     def reset_state(self) -> None:
         """Reset pinch debounce state."""
         self._pinch_active = False
+        self._release_count = 0
+        self._invalidate_cache()
@@ -1,7 +1,10 @@
-from typing import List, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import cv2
 import mediapipe as mp
+import numpy as np
+
+from utils.highgui import poll_key
 
 
 class HandTracker:
@@ -11,7 +14,7 @@ class HandTracker:
     Features:
     - Tracks at most ONE hand per frame (max_num_hands=1)
     - Extracts all 21 landmarks
-    - Returns landmarks as a list of (id, x, y) in pixel coordinates
+    - Returns landmarks as a (21, 2) int32 array of (x, y) pixel coordinates
     - Draws landmarks and connections on the frame for visualization
     """
 
@@ -20,14 +23,50 @@ class HandTracker:
         max_num_hands: int = 1,
         detection_confidence: float = 0.7,
         tracking_confidence: float = 0.7,
+        inference_width: Optional[int] = None,
+        model_complexity: int = 1,
     ) -> None:
+        """
+        Args:
+            max_num_hands: Maximum number of hands MediaPipe should track.
+            detection_confidence: Minimum palm detection confidence.
+            tracking_confidence: Minimum landmark tracking confidence.
+            inference_width: Optional width the frame is downscaled to
+                             before inference; the height follows the
+                             frame's aspect ratio so hands are not
+                             distorted. Landmarks are still returned in the
+                             original frame's pixel coordinates. Narrower
+                             frames are never upscaled.
+            model_complexity: MediaPipe landmark model, 0 (lite, fastest)
+                              or 1 (full).
+        """
+        self._inference_width = inference_width
+
+        # Reused resize and BGR→RGB destinations, reallocated only if the
+        # input size changes
+        self._small_buf: Optional[np.ndarray] = None
+        self._rgb_buf: Optional[np.ndarray] = None
+
         self._mp_hands = mp.solutions.hands
         self._mp_drawing = mp.solutions.drawing_utils
 
+        # Debug drawing styles, built once instead of per drawn frame
+        self._hand_connections = self._mp_hands.HAND_CONNECTIONS
+        self._landmark_spec = self._mp_drawing.DrawingSpec(
+            color=(0, 255, 0),
+            thickness=2,
+            circle_radius=2,
+        )
+        self._connection_spec = self._mp_drawing.DrawingSpec(
+            color=(0, 0, 255),
+            thickness=2,
+        )
+
         # Configure MediaPipe Hands
         self._hands = self._mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=max_num_hands,
+            model_complexity=model_complexity,
             min_detection_confidence=detection_confidence,
             min_tracking_confidence=tracking_confidence,
         )
@@ -36,7 +75,7 @@ class HandTracker:
         self,
         frame_bgr,
         draw: bool = True,
-    ) -> Tuple["cv2.Mat", List[Tuple[int, int, int]]]:
+    ) -> Tuple["cv2.Mat", Optional[np.ndarray]]:
         """
         Detect a single hand and extract landmarks.
 
@@ -45,45 +84,70 @@ class HandTracker:
             draw: If True, draw landmarks and connections on the frame.
 
         Returns:
-            output_frame: Frame with landmarks drawn if draw=True, otherwise original frame.
-            landmarks: List of (id, x, y) pixel coordinates for 21 landmarks.
-                       Returns an empty list if no hand is detected.
+            output_frame: Copy of the frame with landmarks drawn if draw=True and
+                          a hand was found, otherwise the input frame itself.
+            landmarks: (21, 2) int32 array of (x, y) pixel coordinates where
+                       row i is landmark id i.
+                       Returns None if no hand is detected.
         """
-        # Convert BGR (OpenCV) → RGB (MediaPipe)
-        frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+        # Downscale for inference only; MediaPipe cost scales with pixel count.
+        # Both axes share one scale so the aspect ratio is kept, and frames
+        # already at or below the target width are passed through as-is.
+        frame_small = frame_bgr
+        frame_h, frame_w = frame_bgr.shape[:2]
+        if self._inference_width is not None and self._inference_width < frame_w:
+            small_w = self._inference_width
+            small_h = max(1, round(frame_h * small_w / frame_w))
+            small_shape = (small_h, small_w) + frame_bgr.shape[2:]
+            if self._small_buf is None or self._small_buf.shape != small_shape:
+                self._small_buf = np.empty(small_shape, dtype=frame_bgr.dtype)
+            frame_small = cv2.resize(
+                frame_bgr,
+                (small_w, small_h),
+                dst=self._small_buf,
+                interpolation=cv2.INTER_AREA,
+            )
+
+        # Convert BGR (OpenCV) → RGB (MediaPipe) into the reused buffer
+        if self._rgb_buf is None or self._rgb_buf.shape != frame_small.shape:
+            self._rgb_buf = np.empty_like(frame_small)
+        frame_rgb = cv2.cvtColor(frame_small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
 
         # Improve performance: mark image as not writeable during processing
+        # The buffer is reused, so restore the flag even if process() raises;
+        # otherwise every later cvtColor into it would fail.
         frame_rgb.flags.writeable = False
-        results = self._hands.process(frame_rgb)
-        frame_rgb.flags.writeable = True
+        try:
+            results = self._hands.process(frame_rgb)
+        finally:
+            frame_rgb.flags.writeable = True
 
-        output_frame = frame_bgr.copy()
-        landmarks: List[Tuple[int, int, int]] = []
+        output_frame = frame_bgr
+        landmarks: Optional[np.ndarray] = None
 
         if results.multi_hand_landmarks:
             # For this project phase, use only the first detected hand
             hand_landmarks = results.multi_hand_landmarks[0]
 
+            # Landmarks are normalized, so scale by the original frame size
             h, w, _ = output_frame.shape
-            for idx, lm in enumerate(hand_landmarks.landmark):
-                x_px = int(lm.x * w)
-                y_px = int(lm.y * h)
-                landmarks.append((idx, x_px, y_px))
+            points = np.fromiter(
+                (v for lm in hand_landmarks.landmark for v in (lm.x, lm.y)),
+                dtype=np.float32,
+                count=2 * len(hand_landmarks.landmark),
+            ).reshape(-1, 2)
+            points *= (w, h)
+            landmarks = points.astype(np.int32)
 
             if draw:
+                # Copy only when drawing so the caller's frame stays untouched
+                output_frame = frame_bgr.copy()
                 self._mp_drawing.draw_landmarks(
                     image=output_frame,
                     landmark_list=hand_landmarks,
-                    connections=self._mp_hands.HAND_CONNECTIONS,
-                    landmark_drawing_spec=self._mp_drawing.DrawingSpec(
-                        color=(0, 255, 0),
-                        thickness=2,
-                        circle_radius=2,
-                    ),
-                    connection_drawing_spec=self._mp_drawing.DrawingSpec(
-                        color=(0, 0, 255),
-                        thickness=2,
-                    ),
+                    connections=self._hand_connections,
+                    landmark_drawing_spec=self._landmark_spec,
+                    connection_drawing_spec=self._connection_spec,
                 )
 
         return output_frame, landmarks
@@ -93,6 +157,41 @@ class HandTracker:
         self._hands.close()
 
 
+# Process-wide tracker; building the MediaPipe graph takes hundreds of ms
+_shared_tracker: Optional[HandTracker] = None
+_shared_kwargs: Dict[str, Any] = {}
+
+
+def get_shared_tracker(**kwargs: Any) -> HandTracker:
+    """
+    Return the shared HandTracker, creating it on first use.
+
+    kwargs are HandTracker arguments. Asking for different arguments
+    closes the current tracker and builds a new one. MediaPipe keeps
+    tracking state per instance, so only share it between callers that
+    run one after another, never concurrently.
+    """
+    global _shared_tracker, _shared_kwargs
+
+    if _shared_tracker is not None and kwargs == _shared_kwargs:
+        return _shared_tracker
+
+    reset_shared_tracker()
+    _shared_tracker = HandTracker(**kwargs)
+    _shared_kwargs = kwargs
+    return _shared_tracker
+
+
+def reset_shared_tracker() -> None:
+    """Close and forget the shared HandTracker, if any."""
+    global _shared_tracker, _shared_kwargs
+
+    if _shared_tracker is not None:
+        _shared_tracker.close()
+    _shared_tracker = None
+    _shared_kwargs = {}
+
+
 def demo() -> None:
     """
     Manual test for the HandTracker class.
@@ -103,7 +202,7 @@ def demo() -> None:
     - Prints number of landmarks
     """
     cap = cv2.VideoCapture(0)
-    tracker = HandTracker(max_num_hands=1)
+    tracker = get_shared_tracker(max_num_hands=1)
 
     while True:
         success, frame = cap.read()
@@ -114,7 +213,7 @@ def demo() -> None:
 
         cv2.putText(
             frame,
-            f"Landmarks: {len(landmarks)}",
+            f"Landmarks: {0 if landmarks is None else len(landmarks)}",
             (10, 30),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.8,
@@ -124,10 +223,11 @@ def demo() -> None:
         )
 
         cv2.imshow("Hand Tracker Demo", frame)
-        if cv2.waitKey(1) & 0xFF == 27:  # ESC to quit
+        key = poll_key()
+        if key != -1 and key & 0xFF == 27:  # ESC to quit
             break
 
-    tracker.close()
+    reset_shared_tracker()
     cap.release()
     cv2.destroyAllWindows()
 
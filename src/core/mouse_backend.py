@@ -0,0 +1,97 @@
+# src/core/mouse_backend.py
+
+"""
+Low-latency mouse backend.
+
+Mirrors the small part of the PyAutoGUI API this project uses
+(moveTo, click), so the module itself can be passed as the `backend` of
+CursorMapper or ActionController.
+
+PyAutoGUI sleeps for pyautogui.PAUSE (0.1 s by default) after every call,
+which caps a per-frame moveTo at ~10 FPS. Cursor moves here go straight
+to the OS instead:
+- Windows: user32.SetCursorPos
+- macOS: a Quartz mouse-moved event
+- Linux: an XTest motion event
+
+If the native path is unavailable, PyAutoGUI is used with its pause
+disabled.
+"""
+
+import logging
+import platform
+
+import pyautogui
+
+_log = logging.getLogger(__name__)
+
+
+def _pyautogui_move(x: float, y: float) -> None:
+    pyautogui.moveTo(x, y, _pause=False)
+
+
+def _select_move():
+    system = platform.system()
+
+    # Native bindings are optional; any failure falls back to PyAutoGUI
+    try:
+        if system == "Windows":
+            import ctypes
+
+            set_cursor_pos = ctypes.windll.user32.SetCursorPos
+
+            def _move(x: float, y: float) -> None:
+                set_cursor_pos(int(x), int(y))
+
+            return _move
+
+        if system == "Darwin":
+            import Quartz
+
+            def _move(x: float, y: float) -> None:
+                event = Quartz.CGEventCreateMouseEvent(
+                    None,
+                    Quartz.kCGEventMouseMoved,
+                    (x, y),
+                    Quartz.kCGMouseButtonLeft,
+                )
+                Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+            return _move
+
+        if system == "Linux":
+            from Xlib import X
+            from Xlib.display import Display
+            from Xlib.ext import xtest
+
+            display = Display()
+
+            def _move(x: float, y: float) -> None:
+                xtest.fake_input(display, X.MotionNotify, x=int(x), y=int(y))
+                display.sync()
+
+            return _move
+
+    except Exception as e:
+        _log.info(
+            "Native cursor backend for %s unavailable (%s); using PyAutoGUI",
+            system,
+            e,
+        )
+        return _pyautogui_move
+
+    _log.info("No native cursor backend for %s; using PyAutoGUI", system)
+    return _pyautogui_move
+
+
+_move = _select_move()
+
+
+def moveTo(x: float, y: float) -> None:
+    """Move the OS cursor to absolute screen coordinates."""
+    _move(x, y)
+
+
+def click(button: str = "left") -> None:
+    """Press and release a mouse button at the current position."""
+    pyautogui.click(button=button, _pause=False)
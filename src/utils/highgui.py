@@ -0,0 +1,8 @@
+# src/utils/highgui.py
+
+import cv2
+
+
+# cv2.pollKey (OpenCV >= 4.5) pumps window events without the forced
+# 1 ms sleep of cv2.waitKey(1); fall back to waitKey on older builds.
+poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
@@ -0,0 +1,16 @@
+# src/utils/logging_utils.py
+
+import logging
+
+
+def setup_logging(level: int = logging.WARNING) -> None:
+    """
+    Configure root logging for an entry point.
+
+    Library modules only create loggers via logging.getLogger(__name__);
+    anything below `level` is dropped before it is formatted.
+    """
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
@@ -0,0 +1,92 @@
+# tests/test_camera.py
+
+import time
+
+from core.camera import Camera, LatestFrameGrabber
+
+
+class FakeCamera:
+    """Camera stand-in whose frames are the running grab count."""
+
+    def __init__(self, max_frames: int) -> None:
+        self.attempts = 0
+        self.grabbed = 0
+        self.retrieved = 0
+        self._max_frames = max_frames
+
+    def grab(self) -> bool:
+        self.attempts += 1
+        time.sleep(0.001)  # a real grab blocks until the next frame
+        if self.grabbed >= self._max_frames:
+            return False
+        self.grabbed += 1
+        return True
+
+    def retrieve(self):
+        self.retrieved += 1
+        return self.grabbed
+
+
+def test_latest_only_decodes_requested_frames():
+    camera = FakeCamera(max_frames=10_000)
+    grabber = LatestFrameGrabber(camera).start()
+
+    first = grabber.latest(timeout=1.0)
+    second = grabber.latest(timeout=1.0)
+    grabber.stop()
+
+    assert first is not None and second is not None
+    assert second > first
+    # Frames grabbed while nobody was waiting are never decoded
+    assert camera.retrieved == 2
+    assert camera.grabbed > camera.retrieved
+
+
+def test_latest_times_out_without_new_frame():
+    camera = FakeCamera(max_frames=0)
+    grabber = LatestFrameGrabber(camera).start()
+
+    assert grabber.latest(timeout=0.05) is None
+
+    grabber.stop()
+
+
+def test_failed_grabs_back_off():
+    camera = FakeCamera(max_frames=0)
+    grabber = LatestFrameGrabber(camera).start()
+
+    time.sleep(0.1)
+    grabber.stop()
+
+    # ~10 ms between retries, not a busy loop of 1 ms grabs
+    assert camera.attempts <= 15
+
+
+class BufferedCapture:
+    """VideoCapture stand-in holding `buffered` frames before live ones."""
+
+    def __init__(self, buffered: int) -> None:
+        self.grabbed = 0
+        self._buffered = buffered
+
+    def isOpened(self) -> bool:
+        return True
+
+    def grab(self) -> bool:
+        if self.grabbed >= self._buffered:
+            time.sleep(0.02)  # live frames wait for the sensor
+        self.grabbed += 1
+        return True
+
+    def retrieve(self):
+        return True, self.grabbed
+
+
+def test_get_frame_skips_buffered_frames():
+    camera = Camera.__new__(Camera)
+    camera._cap = BufferedCapture(buffered=3)
+    camera._mirror = False
+    camera._fresh_grab_sec = 0.01
+
+    # Three instant grabs are drained, the fourth (live) one is returned
+    assert camera.get_frame() == 4
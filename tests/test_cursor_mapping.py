@@ -106,3 +106,56 @@ def test_center_maps_to_center(cursor_mapper, mock_pyautogui):
     # Center of frame should map to center of screen
     assert x_screen == pytest.approx(screen_width / 2, abs=1)
     assert y_screen == pytest.approx(screen_height / 2, abs=1)
+
+
+def test_mirror_flips_x_axis(mock_pyautogui):
+    """
+    With mirror=True, the left edge of the frame should map to the
+    right edge of the screen while y is unchanged.
+    """
+    mapper = CursorMapper(smoother=Smoother(alpha=1.0), mirror=True)
+    screen_width, _ = mock_pyautogui.size.return_value
+
+    mock_pyautogui.moveTo.reset_mock()
+
+    mapper.move_cursor(
+        x_frame=0,
+        y_frame=0,
+        frame_width=640,
+        frame_height=480,
+    )
+
+    mock_pyautogui.moveTo.assert_called_once()
+    x_screen, y_screen = mock_pyautogui.moveTo.call_args[0][:2]
+
+    assert x_screen == pytest.approx(screen_width, abs=1)
+    assert y_screen == pytest.approx(0, abs=1)
+
+
+def test_frame_size_change_updates_scale(cursor_mapper, mock_pyautogui):
+    """
+    Scale factors are cached per frame size; a new frame size must not
+    reuse the old ones.
+    """
+    screen_width, screen_height = mock_pyautogui.size.return_value
+
+    cursor_mapper.move_cursor(
+        x_frame=320,
+        y_frame=240,
+        frame_width=640,
+        frame_height=480,
+    )
+
+    mock_pyautogui.moveTo.reset_mock()
+
+    cursor_mapper.move_cursor(
+        x_frame=1280,
+        y_frame=720,
+        frame_width=1280,
+        frame_height=720,
+    )
+
+    x_screen, y_screen = mock_pyautogui.moveTo.call_args[0][:2]
+
+    assert x_screen == pytest.approx(screen_width, abs=1)
+    assert y_screen == pytest.approx(screen_height, abs=1)
@@ -1,5 +1,7 @@
 #test/test_gesture_recognizer.py
 
+import numpy as np
+
 from core.gesture_recognizer import GestureRecognizer
 
 
@@ -25,3 +27,80 @@ def test_click_event_only_once_per_pinch():
     assert gr.detect_click_event(pinch) is True
     assert gr.detect_click_event(pinch) is False
     assert gr.detect_click_event(no_pinch) is False
+
+
+def _hand_array(thumb, index):
+    landmarks = np.zeros((21, 2), dtype=np.int32)
+    landmarks[4] = thumb
+    landmarks[8] = index
+    return landmarks
+
+
+def test_pinch_from_tracker_array():
+    gr = GestureRecognizer(pinch_threshold=50)
+    assert gr.is_pinch(_hand_array((100, 100), (120, 110)))
+    assert not gr.is_pinch(_hand_array((100, 100), (250, 250)))
+
+
+def test_no_hand_resets_click_state():
+    gr = GestureRecognizer(pinch_threshold=50)
+    pinch = _hand_array((100, 100), (120, 110))
+
+    assert gr.detect_click_event(pinch) is True
+    assert gr.detect_click_event(None) is False
+    assert gr.detect_click_event(pinch) is True
+
+
+def test_pinch_threshold_is_inclusive():
+    gr = GestureRecognizer(pinch_threshold=50)
+    # 3-4-5 triangle scaled to exactly the threshold
+    assert gr.is_pinch([(4, 0, 0), (8, 30, 40)])
+    assert not gr.is_pinch([(4, 0, 0), (8, 30, 41)])
+
+
+def test_pinch_from_full_ordered_list():
+    gr = GestureRecognizer(pinch_threshold=50)
+    landmarks = [(i, 0, 0) for i in range(21)]
+    landmarks[4] = (4, 100, 100)
+    landmarks[8] = (8, 120, 110)
+    assert gr.is_pinch(landmarks)
+
+
+def test_set_pinch_threshold():
+    gr = GestureRecognizer(pinch_threshold=50)
+    landmarks = [(4, 0, 0), (8, 30, 40)]
+
+    gr.set_pinch_threshold(49)
+    assert not gr.is_pinch(landmarks)
+
+    gr.set_pinch_threshold(50)
+    assert gr.is_pinch(landmarks)
+
+
+def test_pinch_result_cached_for_same_landmarks():
+    gr = GestureRecognizer(pinch_threshold=50)
+    landmarks = _hand_array((100, 100), (120, 110))
+
+    assert gr.is_pinch(landmarks)
+
+    # Same object is not re-evaluated; a fresh frame is
+    landmarks[8] = (250, 250)
+    assert gr.is_pinch(landmarks)
+    assert not gr.is_pinch(landmarks.copy())
+
+
+def test_release_frames_ignore_short_dropout():
+    gr = GestureRecognizer(pinch_threshold=50, release_frames=3)
+    pinch = [(4, 100, 100), (8, 120, 110)]
+    open_hand = [(4, 100, 100), (8, 250, 250)]
+
+    assert gr.detect_click_event(pinch) is True
+    # Two open frames are a dropout, not a release
+    assert gr.detect_click_event(open_hand) is False
+    assert gr.detect_click_event(open_hand) is False
+    assert gr.detect_click_event(pinch) is False
+
+    # Three open frames release the pinch
+    for _ in range(3):
+        assert gr.detect_click_event(open_hand) is False
+    assert gr.detect_click_event(pinch) is True
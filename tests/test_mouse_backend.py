@@ -0,0 +1,27 @@
+# tests/test_mouse_backend.py
+
+import sys
+from unittest.mock import patch
+
+from core import mouse_backend
+
+
+def test_unknown_platform_falls_back_to_pyautogui():
+    with patch("core.mouse_backend.platform.system", return_value="Plan9"):
+        assert mouse_backend._select_move() is mouse_backend._pyautogui_move
+
+
+def test_missing_native_binding_falls_back_to_pyautogui():
+    # A None entry in sys.modules makes `import Xlib` raise ImportError
+    with (
+        patch("core.mouse_backend.platform.system", return_value="Linux"),
+        patch.dict(sys.modules, {"Xlib": None}),
+    ):
+        assert mouse_backend._select_move() is mouse_backend._pyautogui_move
+
+
+def test_fallback_move_skips_pyautogui_pause():
+    with patch("core.mouse_backend.pyautogui") as mock_pg:
+        mouse_backend._pyautogui_move(10, 20)
+
+    mock_pg.moveTo.assert_called_once_with(10, 20, _pause=False)